@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
-import threading
+from functools import partial
+import hashlib
+import json
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional
 
 import pandas as pd
-from fastapi import FastAPI, File, HTTPException, Query, UploadFile, status
+from fastapi import FastAPI, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
@@ -36,8 +44,8 @@ from utils.yaml_handler import dump_yaml, load_yaml
 from utils import eda_tools
 from utils.data_analyzer import analyze_csv
 from utils.validator import validate_data as run_data_validation
-from utils.timeline_builder import build_continuous_timeline
-from utils.aggregator import aggregate_data as run_aggregation
+from utils.timeline_builder import build_timeline_from_file
+from utils.aggregator import aggregate_file as run_aggregation
 
 BASE_DIR = Path(__file__).parent
 CONFIG_ROOT = BASE_DIR / "configs"
@@ -52,6 +60,8 @@ HISTORY_PATH = build_history_path(CONFIG_ROOT)
 LATEST_UPLOAD_INFO = UPLOADS_DIR / "latest_upload.json"
 UPLOAD_RETENTION_HOURS = 2
 CLEANUP_INTERVAL_SECONDS = 900
+PROCESS_POOL_WORKERS = max(1, min(4, os.cpu_count() or 1))
+UPLOAD_CHUNK_BYTES = 1 << 20
 
 for folder in [CONFIG_ROOT, CONFIG_ROOT / "dev", CONFIG_ROOT / "prod", DATA_DIR]:
     ensure_directory(folder)
@@ -67,6 +77,9 @@ DEFAULTS = {
     "config_version": "1.0",
 }
 
+DEFAULTS_BODY = json.dumps(DEFAULTS).encode("utf-8")
+PUBLIC_CACHE_SECONDS = 300
+
 ALLOWED_ENVS = {"dev", "prod"}
 
 
@@ -101,8 +114,27 @@ class RollupRequest(BaseModel):
     restaurant_values: Dict[str, float]
 
 
-cleanup_stop_event = threading.Event()
-cleanup_thread: Optional[threading.Thread] = None
+process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _cached_json_response(request: Request, body: bytes, max_age: int | None = None) -> Response:
+    """
+    Serve a JSON body with an ETag, answering 304 when the client already holds it.
+
+    Without max_age the client must revalidate on every use (for mutable data).
+    """
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}" if max_age else "no-cache",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _json_bytes(payload: object) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
 
 
 def _relative_to_base(path: Path) -> str:
@@ -120,60 +152,93 @@ def _record_latest_upload(path: Path) -> None:
     write_json(LATEST_UPLOAD_INFO, payload)
 
 
-def _persist_upload(content: bytes, original_name: str | None, label: str) -> Path:
+async def _persist_upload(file: UploadFile, label: str) -> Path:
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    suffix = Path(original_name or f"{label}.csv").suffix or ".csv"
+    suffix = Path(file.filename or f"{label}.csv").suffix or ".csv"
     filename = f"{timestamp}_{label}{suffix}"
-    destination = ensure_directory(UPLOADS_DIR) / filename
-    destination.write_bytes(content)
+    # UPLOADS_DIR is created at import time.
+    destination = UPLOADS_DIR / filename
+    with destination.open("wb") as target:
+        while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+            await run_in_threadpool(target.write, chunk)
     return destination
 
 
-def _cleanup_old_uploads(stop_event: threading.Event) -> None:
-    while not stop_event.is_set():
-        now = datetime.utcnow()
-        uploads_dir = ensure_directory(UPLOADS_DIR)
-        cutoff = timedelta(hours=UPLOAD_RETENTION_HOURS)
-        for file in uploads_dir.glob("*.csv"):
+def _sweep_old_uploads() -> None:
+    now = datetime.utcnow()
+    cutoff = timedelta(hours=UPLOAD_RETENTION_HOURS)
+    try:
+        entries = os.scandir(UPLOADS_DIR)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".csv"):
+                continue
             try:
-                modified_time = datetime.fromtimestamp(file.stat().st_mtime)
+                modified_time = datetime.fromtimestamp(entry.stat().st_mtime)
             except OSError:
                 continue
             if now - modified_time > cutoff:
                 try:
-                    file.unlink()
+                    os.unlink(entry.path)
                 except OSError as exc:
-                    print(f"Failed to remove {file}: {exc}")
-        stop_event.wait(CLEANUP_INTERVAL_SECONDS)
+                    print(f"Failed to remove {entry.path}: {exc}")
 
 
-def _start_cleanup_thread() -> None:
-    global cleanup_thread
-    if cleanup_thread and cleanup_thread.is_alive():
-        return
-    cleanup_stop_event.clear()
-    cleanup_thread = threading.Thread(
-        target=_cleanup_old_uploads,
-        args=(cleanup_stop_event,),
-        daemon=True,
-        name="upload-cleanup-worker",
+async def _cleanup_old_uploads() -> None:
+    while True:
+        await asyncio.to_thread(_sweep_old_uploads)
+        await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
+
+
+def _create_process_pool() -> ProcessPoolExecutor:
+    # Workers start lazily, possibly while threadpool threads hold pandas/BLAS locks, so never fork.
+    return ProcessPoolExecutor(
+        max_workers=PROCESS_POOL_WORKERS,
+        mp_context=multiprocessing.get_context("forkserver"),
     )
-    cleanup_thread.start()
 
 
-def _stop_cleanup_thread() -> None:
-    cleanup_stop_event.set()
-    if cleanup_thread and cleanup_thread.is_alive():
-        cleanup_thread.join(timeout=5)
+def _replace_broken_pool(broken: ProcessPoolExecutor) -> None:
+    global process_pool
+    # Concurrent jobs see the same breakage; only the first one swaps the pool.
+    if process_pool is broken:
+        process_pool = _create_process_pool()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_process(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run CPU-heavy pandas work in the worker pool so concurrent requests scale across cores."""
+    loop = asyncio.get_running_loop()
+    job = partial(func, *args, **kwargs)
+    for _ in range(2):
+        pool = process_pool
+        if pool is None:
+            return await run_in_threadpool(job)
+        try:
+            return await loop.run_in_executor(pool, job)
+        except BrokenProcessPool:
+            # A worker died mid-job (e.g. killed for memory); a broken pool never recovers.
+            _replace_broken_pool(pool)
+    raise HTTPException(
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Background worker stopped unexpectedly. Please retry.",
+    )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    _start_cleanup_thread()
+    global process_pool
+    process_pool = _create_process_pool()
+    cleanup_task = asyncio.create_task(_cleanup_old_uploads(), name="upload-cleanup")
     try:
         yield
     finally:
-        _stop_cleanup_thread()
+        cleanup_task.cancel()
+        await asyncio.gather(cleanup_task, return_exceptions=True)
+        process_pool.shutdown(wait=False, cancel_futures=True)
+        process_pool = None
 
 
 app = FastAPI(title="Forecast Workbench API", version="0.3.0", lifespan=lifespan)
@@ -252,24 +317,26 @@ def append_audit(message: str, role: str, env: str) -> None:
 
 
 @app.get("/api/defaults")
-def get_defaults() -> Dict[str, str | int]:
-    return DEFAULTS
+def get_defaults(request: Request) -> Response:
+    return _cached_json_response(request, DEFAULTS_BODY, max_age=PUBLIC_CACHE_SECONDS)
 
 
 @app.get("/api/holidays")
 def list_holidays(
+    request: Request,
     country: str,
     start_date: date,
     end_date: date,
-):
+) -> Response:
     holidays_list = get_holidays(country, start_date, end_date)
-    return {
+    payload = {
         "country": country.upper(),
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
         "count": len(holidays_list),
         "holidays": holidays_list,
     }
+    return _cached_json_response(request, _json_bytes(payload), max_age=PUBLIC_CACHE_SECONDS)
 
 
 @app.get("/api/load_config")
@@ -427,12 +494,13 @@ def normalize_hierarchy_payload(payload: Dict[str, Dict[str, str]]) -> Dict[str,
 
 
 @app.get("/api/hierarchy_mapping")
-async def get_hierarchy_mapping():
+async def get_hierarchy_mapping(request: Request) -> Response:
     mapping = read_json(HIERARCHY_PATH, default={
         "restaurant_to_city": {"Restaurant A": "Mumbai"},
         "city_to_country": {"Mumbai": "India"},
     })
-    return normalize_hierarchy_payload(mapping)
+    # The mapping is editable, so clients revalidate via ETag instead of caching blindly.
+    return _cached_json_response(request, _json_bytes(normalize_hierarchy_payload(mapping)))
 
 
 @app.post("/api/hierarchy_mapping")
@@ -453,25 +521,18 @@ async def test_rollup(request: RollupRequest):
     restaurant_to_city = mapping.get("restaurant_to_city", {})
     city_to_country = mapping.get("city_to_country", {})
 
-    city_totals: Dict[str, float] = {}
-    country_totals: Dict[str, float] = {}
-
-    for restaurant, value in request.restaurant_values.items():
-        city = restaurant_to_city.get(restaurant, "Unknown")
-        city_totals[city] = city_totals.get(city, 0) + value
-        country = city_to_country.get(city, "Unknown")
-        country_totals[country] = country_totals.get(country, 0) + value
+    values = pd.Series(request.restaurant_values, dtype="float64")
+    cities = values.groupby(values.index.map(restaurant_to_city).fillna("Unknown"), sort=False).sum()
+    countries = cities.groupby(cities.index.map(city_to_country).fillna("Unknown"), sort=False).sum()
 
     return {
-        "cities": city_totals,
-        "countries": country_totals,
+        "cities": cities.to_dict(),
+        "countries": countries.to_dict(),
     }
 
 
 async def _ingest_upload(file: UploadFile, label: str) -> Path:
-    content = await file.read()
-    saved_path = _persist_upload(content, file.filename, label)
-    return saved_path
+    return await _persist_upload(file, label)
 
 
 def _ensure_latest_upload_path() -> Path:
@@ -521,7 +582,7 @@ async def ingest_data(
         )
 
     try:
-        summary = run_data_validation(filename=str(primary_path))
+        summary = await _run_in_process(run_data_validation, filename=str(primary_path))
     except FileNotFoundError as exc:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except ValueError as exc:
@@ -540,10 +601,9 @@ async def upload_csv(file: UploadFile = File(...)):
     Handles CSV uploads for restaurant sales data.
     """
     try:
-        content = await file.read()
-        saved_path = _persist_upload(content, file.filename, "sales")
+        saved_path = await _persist_upload(file, "sales")
         _record_latest_upload(saved_path)
-        summary = analyze_csv(content)
+        summary = await _run_in_process(analyze_csv, saved_path)
         return {
             "status": "success",
             "data": summary,
@@ -559,8 +619,10 @@ async def validate_data(filename: str | None = None):
     Cleans the latest uploaded CSV (or a provided filename) and returns validation metadata.
     """
     try:
-        summary = run_data_validation(filename=filename)
+        summary = await _run_in_process(run_data_validation, filename=filename)
         return {"status": "success", "summary": summary}
+    except HTTPException:
+        raise
     except FileNotFoundError as exc:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except ValueError as exc:
@@ -577,9 +639,8 @@ async def build_timeline():
             detail="Validated dataset not found. Run /api/validate_data first.",
         )
 
-    df = pd.read_csv(VALIDATED_FILE)
     try:
-        summary = build_continuous_timeline(df)
+        summary = await _run_in_process(build_timeline_from_file, VALIDATED_FILE)
     except ValueError as exc:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return {"status": "success", "summary": summary}
@@ -593,16 +654,15 @@ async def aggregate_data():
             detail="Continuous dataset not found. Run /api/build_timeline first.",
         )
 
-    df = pd.read_csv(CONTINUOUS_FILE)
     try:
-        summary = run_aggregation(df)
+        summary = await _run_in_process(run_aggregation, CONTINUOUS_FILE)
     except ValueError as exc:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return {"status": "success", "summary": summary}
 
 
 @app.get("/api/eda/summary")
-async def eda_summary(granularity: Literal["daily", "weekly", "monthly"] = Query("daily")):
+def eda_summary(granularity: Literal["daily", "weekly", "monthly"] = Query("daily")):
     try:
         df = eda_tools.load_data(granularity)
         summary = {
@@ -620,7 +680,7 @@ async def eda_summary(granularity: Literal["daily", "weekly", "monthly"] = Query
 
 
 @app.get("/api/eda/correlation")
-async def eda_correlation(granularity: Literal["daily", "weekly", "monthly"] = Query("daily")):
+def eda_correlation(granularity: Literal["daily", "weekly", "monthly"] = Query("daily")):
     try:
         df = eda_tools.load_data(granularity)
         correlation = eda_tools.correlation_summary(df)
@@ -630,7 +690,7 @@ async def eda_correlation(granularity: Literal["daily", "weekly", "monthly"] = Q
 
 
 @app.get("/api/eda/timeseries")
-async def eda_timeseries(granularity: Literal["daily", "weekly", "monthly"] = Query("daily")):
+def eda_timeseries(granularity: Literal["daily", "weekly", "monthly"] = Query("daily")):
     try:
         df = eda_tools.load_data(granularity)
         timeseries = eda_tools.timeseries_summary(df, granularity=granularity)
@@ -642,7 +702,7 @@ async def eda_timeseries(granularity: Literal["daily", "weekly", "monthly"] = Qu
 
 
 @app.get("/api/eda/distribution")
-async def eda_distribution(
+def eda_distribution(
     column: str = Query("sales_qty"),
     granularity: Literal["daily", "weekly", "monthly"] = Query("daily"),
     bins: int = Query(20, ge=5, le=120),
@@ -658,7 +718,7 @@ async def eda_distribution(
 
 
 @app.get("/api/eda/datahead")
-async def eda_datahead(
+def eda_datahead(
     granularity: Literal["daily", "weekly", "monthly"] = Query("daily"),
     limit: int = Query(10, ge=1, le=200),
 ):
@@ -0,0 +1,32 @@
+from utils.data_analyzer import analyze_csv
+
+
+def test_repeated_header_names_are_analyzed(tmp_path):
+    upload = tmp_path / "sales.csv"
+    upload.write_text("date,sales,sales\n2024-01-01,1,2\n2024-01-02,3,4\n")
+
+    summary = analyze_csv(upload)
+
+    assert summary["columns"] == ["date", "sales", "sales"]
+    assert summary["target_column"] == "sales"
+    assert summary["rows"] == 2
+
+
+def test_integer_encoded_dates_are_never_the_target(tmp_path):
+    upload = tmp_path / "sales.csv"
+    upload.write_text("date,qty\n20240101,1\n20240102,2\n20240103,3\n")
+
+    summary = analyze_csv(upload)
+
+    assert summary["target_column"] == "qty"
+    assert summary["frequency"] == "daily"
+
+
+def test_fallback_target_skips_non_numeric_keyword_columns(tmp_path):
+    upload = tmp_path / "sales.csv"
+    upload.write_text("order_date,sales_channel,units\n2024-01-01,web,1\n2024-01-08,app,2\n")
+
+    summary = analyze_csv(upload)
+
+    assert summary["target_column"] == "units"
+    assert summary["frequency"] == "weekly"
@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.eda_tools import distribution_summary
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[0, 2**62], [-(2**62), 2**62], [0, np.iinfo(np.int64).max], [1, 2, 2, 3, 7, 9, 20], [5, -5, 0, 0]],
+)
+def test_integer_distribution_matches_numpy(values):
+    frame = pd.DataFrame({"sales_qty": np.array(values, dtype=np.int64)})
+    counts, edges = np.histogram(frame["sales_qty"], bins=20)
+
+    summary = distribution_summary(frame, bins=20)
+
+    assert summary == {"bins": edges.tolist(), "counts": counts.tolist()}
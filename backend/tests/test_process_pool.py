@@ -0,0 +1,23 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+
+import main
+
+
+@pytest.fixture
+def pool():
+    main.process_pool = main._create_process_pool()
+    yield
+    main.process_pool.shutdown(wait=True, cancel_futures=True)
+    main.process_pool = None
+
+
+def test_broken_pool_is_replaced(pool):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(main._run_in_process(os._exit, 1))
+    assert error.value.status_code == 503
+
+    assert asyncio.run(main._run_in_process(abs, -3)) == 3
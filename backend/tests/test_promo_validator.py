@@ -0,0 +1,47 @@
+import pytest
+
+from utils.promo_validator import granularity_alignment_warning, rows_from_bytes, validate_promo_rows
+
+
+def _row(start: str, end: str) -> dict:
+    return {"name": "Promo", "start_date": start, "end_date": end, "type": "discount"}
+
+
+def _issues(start: str, end: str) -> list:
+    _, invalid = validate_promo_rows([_row(start, end)])
+    return invalid[0]["issues"] if invalid else []
+
+
+@pytest.mark.parametrize("value", ["2024/01/01", "2024-1-5", "2024-01", "2024"])
+def test_non_iso_shapes_are_flagged(value):
+    assert _issues(value, "2024-12-31") == ["date_format"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2024-01-01", "2024-W01-1", "20240101", "2024-01-01T10", "2024-01-01 10:30:00.123"],
+)
+def test_fromisoformat_shapes_are_accepted(value):
+    assert _issues(value, "2024-12-31") == []
+
+
+def test_end_before_start_is_flagged():
+    assert _issues("2024-02-01", "2024-W01-1") == ["date_order"]
+
+
+def test_missing_fields_and_dates_are_reported_together():
+    _, invalid = validate_promo_rows([{"name": "", "start_date": "", "end_date": "2024-01-02", "type": "x"}])
+    assert invalid[0]["issues"] == ["name", "start_date", "date_format"]
+
+
+def test_accepted_rows_pass_the_granularity_guardrail():
+    rows = [_row("2024-W01-1", "2024-01-07"), _row("2024-01-08", "2024-01-14")]
+    _, invalid = validate_promo_rows(rows)
+    assert invalid == []
+    assert granularity_alignment_warning(rows, "weekly") is None
+
+
+def test_repeated_header_falls_back_to_csv_module():
+    rows, missing = rows_from_bytes(b"name,start_date,end_date,name\nA,2024-01-01,2024-01-02,B\n")
+    assert rows == [{"name": "B", "start_date": "2024-01-01", "end_date": "2024-01-02"}]
+    assert missing == ["type"]
@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from utils import validator
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(validator, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(validator, "VALIDATED_DIR", tmp_path / "validated")
+    monkeypatch.setattr(validator, "VALIDATION_CHUNK_ROWS", 4)
+    return tmp_path
+
+
+def _read_validated(workspace):
+    return pd.read_csv(workspace / "validated" / "validated_raw_data.csv", dtype=str)
+
+
+def test_duplicates_spanning_chunks_are_removed(workspace):
+    upload = workspace / "sales.csv"
+    upload.write_text(
+        "store_id,date,qty\n"
+        "1,2024-01-01,5\n1,2024-01-02,6\n2,2024-01-01,7\n,2024-01-01,1\n"
+        "1,2024-01-01,9\n2,2024-01-01,8\n1,2024-01-03,4\n2,2024-01-02,3\n"
+    )
+
+    summary = validator.validate_data(str(upload))
+
+    assert summary["rows_before"] == 8
+    assert summary["duplicates_removed"] == 2
+    validated = _read_validated(workspace)
+    assert sorted(validated["series_id"].unique()) == ["1", "2", "single_series"]
+    assert validated.loc[validated["series_id"] == "1", "sales_qty"].tolist() == ["5", "6", "4"]
+
+
+def test_date_format_is_detected_once_across_chunks(workspace):
+    upload = workspace / "sales.csv"
+    upload.write_text("date,qty\n2024-01-01,1\n2024-01-02,2\n2024-01-03,3\n2024-01-04,4\n2024-01-05,5\n")
+
+    summary = validator.validate_data(str(upload))
+
+    assert summary["rows_after"] == 5
+
+
+def test_dates_render_consistently_across_chunks(workspace):
+    upload = workspace / "sales.csv"
+    rows = ["2024-01-01 00:00:00", "2024-01-02 00:00:00", "2024-01-03 00:00:00", "2024-01-04 00:00:00"]
+    rows += ["2024-01-05 10:30:00", "2024-01-06 00:00:00"]
+    upload.write_text("date,qty\n" + "".join(f"{value},1\n" for value in rows))
+
+    validator.validate_data(str(upload))
+
+    assert _read_validated(workspace)["date"].tolist() == rows
+
+
+def test_concurrent_validations_stage_separately(workspace):
+    uploads = []
+    for index in range(4):
+        upload = workspace / f"sales_{index}.csv"
+        upload.write_text("date,qty\n" + "".join(f"2024-01-{day:02d},{index}\n" for day in range(1, 21)))
+        uploads.append(str(upload))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        summaries = list(pool.map(validator.validate_data, uploads))
+
+    assert [summary["rows_after"] for summary in summaries] == [20] * 4
+    assert len(_read_validated(workspace)) == 20
+    assert list((workspace / "validated").glob("*.tmp")) == []
@@ -5,12 +5,34 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
+from utils.date_parsing import parse_dates
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 VALIDATED_DIR = BASE_DIR / "data" / "validated"
 
 
+def _write_outputs(frame: pd.DataFrame, csv_path: Path) -> None:
+    """Write the CSV export plus a typed Parquet copy that the EDA endpoints read."""
+    frame.to_csv(csv_path, index=False)
+    frame.to_parquet(csv_path.with_suffix(".parquet"), index=False, compression="zstd")
+
+
+def _rollup(partials: pd.DataFrame, id_col: str, bucket: str, has_price: bool) -> pd.DataFrame:
+    rolled = partials.groupby(level=[id_col, bucket], observed=True).sum()
+    # Sales totals are whole units; store them as the narrowest integer type that fits.
+    rolled["sales_qty"] = pd.to_numeric(rolled["sales_qty"], downcast="integer")
+    if has_price:
+        rolled["price"] = rolled["price_sum"] / rolled["price_count"].where(rolled["price_count"] > 0)
+        rolled = rolled.drop(columns=["price_sum", "price_count"])
+    rolled = rolled.reset_index()
+    # The categorical key is only a grouping aid; write plain ids to the outputs.
+    rolled[id_col] = rolled[id_col].astype(rolled[id_col].cat.categories.dtype)
+    return rolled
+
+
 def aggregate_data(
     df: pd.DataFrame,
     id_col: str = "series_id",
@@ -22,22 +44,30 @@ def aggregate_data(
     if id_col not in df.columns or date_col not in df.columns:
         raise ValueError(f"Columns '{id_col}' and '{date_col}' are required for aggregation.")
 
-    df = df.copy()
-    df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+    # The caller hands over a freshly read frame, so convert in place rather than copying it.
+    df[date_col] = parse_dates(df[date_col])
     if df[date_col].isna().all():
         raise ValueError("Date column could not be parsed for aggregation.")
 
-    df["week"] = df[date_col].dt.to_period("W").apply(lambda period: period.start_time)
-    df["month"] = df[date_col].dt.to_period("M").apply(lambda period: period.start_time)
+    df = df.dropna(subset=[date_col])
+    days = df[date_col].to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    # 1970-01-01 was a Thursday; shifting by 3 makes Monday weekday 0.
+    weekday = (days.astype(np.int64) + 3) % 7
+    week = pd.Index((days - weekday).astype("datetime64[ns]"), name="week")
+    month = pd.Index(days.astype("datetime64[M]").astype("datetime64[ns]"), name="month")
 
-    aggregations = {
-        "sales_qty": "sum",
-    }
-    if "price" in df.columns:
-        aggregations["price"] = "mean"
+    has_price = "price" in df.columns
+    aggregations = {"sales_qty": ("sales_qty", "sum")}
+    if has_price:
+        aggregations["price_sum"] = ("price", "sum")
+        aggregations["price_count"] = ("price", "count")
 
-    agg_week = df.groupby([id_col, "week"]).agg(aggregations).reset_index()
-    agg_month = df.groupby([id_col, "month"]).agg(aggregations).reset_index()
+    # Single pass over the daily rows: (week, month) buckets never straddle a
+    # month boundary, so both rollups can be derived exactly from the partials.
+    series_ids = df[id_col].astype("category")
+    partials = df.groupby([series_ids, week, month], observed=True).agg(**aggregations)
+    agg_week = _rollup(partials, id_col, "week", has_price)
+    agg_month = _rollup(partials, id_col, "month", has_price)
 
     VALIDATED_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -45,11 +75,11 @@ def aggregate_data(
     weekly_path = VALIDATED_DIR / "weekly_data.csv"
     monthly_path = VALIDATED_DIR / "monthly_data.csv"
 
-    df.to_csv(daily_path, index=False)
     agg_week.rename(columns={"week": date_col}, inplace=True)
     agg_month.rename(columns={"month": date_col}, inplace=True)
-    agg_week.to_csv(weekly_path, index=False)
-    agg_month.to_csv(monthly_path, index=False)
+    _write_outputs(df, daily_path)
+    _write_outputs(agg_week, weekly_path)
+    _write_outputs(agg_month, monthly_path)
 
     return {
         "status": "success",
@@ -62,3 +92,8 @@ def aggregate_data(
             "monthly": str(monthly_path.relative_to(BASE_DIR)),
         },
     }
+
+
+def aggregate_file(path: Path) -> Dict[str, object]:
+    """Load a continuous CSV and aggregate it; suited to worker processes."""
+    return aggregate_data(pd.read_csv(path, engine="pyarrow"))
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from io import BytesIO
+import re
+from pathlib import Path
 from typing import Literal, TypedDict
 
+import numpy as np
 import pandas as pd
+import pyarrow.csv as pacsv
+
+from utils.date_parsing import parse_dates
+
+TARGET_COLUMN_PATTERN = re.compile(r"sale|revenue|amount|gmv")
+LOCATION_COLUMN_PATTERN = re.compile(r"store|city|location")
 
 
 class SuggestedConfig(TypedDict):
@@ -29,48 +37,82 @@ class AnalysisSummary(TypedDict):
     suggested_config: SuggestedConfig
 
 
-def analyze_csv(file_bytes: bytes) -> AnalysisSummary:
-    """Parse restaurant sales CSV bytes and infer cadence, hierarchy, and defaults."""
-    if not file_bytes:
-        raise ValueError("Uploaded file is empty.")
+def _read_header(path: Path) -> tuple[list[str], bool]:
+    """Return the header names and whether any data row follows, reading at most one block."""
+    try:
+        with pacsv.open_csv(path) as reader:
+            has_rows = any(batch.num_rows for batch in reader)
+            return reader.schema.names, has_rows
+    except Exception as exc:  # pragma: no cover - pyarrow parsing errors vary
+        raise ValueError("Unable to read CSV file.") from exc
+
 
+def _read_positions(path: Path, positions: list[int]) -> pd.DataFrame:
+    """Read columns by header position with the same engine as the header, so repeated names are safe."""
+    positions = sorted(positions)
     try:
-        df = pd.read_csv(BytesIO(file_bytes))
+        frame = pd.read_csv(path, engine="pyarrow", header=None, skiprows=1, usecols=positions)
     except Exception as exc:  # pragma: no cover - pandas parsing errors vary
         raise ValueError("Unable to read CSV file.") from exc
+    frame.columns = positions
+    return frame
 
-    if df.empty:
-        raise ValueError("Uploaded file has no rows.")
 
-    df.columns = [str(column).strip().lower() for column in df.columns]
+def _first_numeric(frame: pd.DataFrame, positions: list[int]) -> int | None:
+    return next((position for position in positions if pd.api.types.is_numeric_dtype(frame[position])), None)
+
+
+def _normalize_column(column: object) -> str:
+    return str(column).strip().lower()
+
+
+def analyze_csv(path: Path) -> AnalysisSummary:
+    """Parse a stored restaurant sales CSV and infer cadence, hierarchy, and defaults."""
+    if path.stat().st_size == 0:
+        raise ValueError("Uploaded file is empty.")
+
+    header, has_rows = _read_header(path)
+    if not has_rows:
+        raise ValueError("Uploaded file has no rows.")
+    columns = [_normalize_column(column) for column in header]
 
     # Detect date column by matching name patterns
-    date_col = next((col for col in df.columns if "date" in col), None)
+    date_col = next((col for col in columns if "date" in col), None)
     if date_col is None:
         raise ValueError("No date column found in CSV.")
-
-    df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-    df = df.dropna(subset=[date_col]).sort_values(by=date_col)
-    if df.empty:
+    date_position = columns.index(date_col)
+
+    # Only the date column and likely target columns need to be parsed.
+    candidates = [
+        position
+        for position, col in enumerate(columns)
+        if position != date_position and TARGET_COLUMN_PATTERN.search(col)
+    ]
+    df = _read_positions(path, [date_position, *candidates])
+
+    dates = parse_dates(df[date_position])
+    valid_dates = dates.dropna().sort_values()
+    if valid_dates.empty:
         raise ValueError("Date column could not be parsed. Please check the format.")
 
-    numeric_cols = df.select_dtypes(include="number").columns.tolist()
-    target_col = None
-    for column in numeric_cols:
-        if any(keyword in column for keyword in ("sale", "revenue", "amount", "gmv")):
-            target_col = column
-            break
-    if target_col is None:
-        target_col = numeric_cols[0] if numeric_cols else None
-
-    has_location_signal = any(
-        any(keyword in column for keyword in ("store", "city", "location"))
-        for column in df.columns
-    )
+    target_position = _first_numeric(df, candidates)
+    if target_position is None:
+        # No numeric keyword match: look at the columns not read yet, never the date column.
+        remaining = [
+            position
+            for position in range(len(columns))
+            if position != date_position and position not in candidates
+        ]
+        if remaining:
+            target_position = _first_numeric(_read_positions(path, remaining), remaining)
+    target_col = columns[target_position] if target_position is not None else None
+
+    has_location_signal = any(LOCATION_COLUMN_PATTERN.search(column) for column in columns)
     hierarchy = "multi-location" if has_location_signal else "single-restaurant"
 
-    deltas = df[date_col].diff().dt.days.dropna()
-    avg_gap = int(deltas.mode().iloc[0]) if not deltas.empty else 1
+    # Rows are sorted by date, so gaps are non-negative day counts and bincount finds the mode.
+    deltas = valid_dates.diff().dt.days.dropna().to_numpy(dtype=np.int64)
+    avg_gap = int(np.bincount(deltas).argmax()) if deltas.size else 1
     avg_gap = max(avg_gap, 1)
 
     if avg_gap <= 1:
@@ -88,13 +130,13 @@ def analyze_csv(file_bytes: bytes) -> AnalysisSummary:
         "country": "India",
     }
 
-    rows = len(df)
+    rows = len(valid_dates)
     summary: AnalysisSummary = {
-        "columns": df.columns.tolist(),
+        "columns": columns,
         "date_column": date_col,
         "target_column": target_col,
-        "start_date": df[date_col].min().strftime("%Y-%m-%d"),
-        "end_date": df[date_col].max().strftime("%Y-%m-%d"),
+        "start_date": valid_dates.iloc[0].strftime("%Y-%m-%d"),
+        "end_date": valid_dates.iloc[-1].strftime("%Y-%m-%d"),
         "frequency": frequency,
         "hierarchy": hierarchy,
         "rows": rows,
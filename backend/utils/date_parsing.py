@@ -0,0 +1,61 @@
+"""Fast-path datetime parsing for CSV-sourced date columns."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+KNOWN_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+)
+
+
+def _detect_format(sample: str) -> str | None:
+    for fmt in KNOWN_DATE_FORMATS:
+        try:
+            datetime.strptime(sample, fmt)
+        except ValueError:
+            continue
+        return fmt
+    return None
+
+
+def infer_date_format(values: pd.Series) -> str | None:
+    """
+    Pick one format for a column from its first present value.
+
+    Known formats are tried first, then pandas' own guesser; None means the values
+    have to be parsed element by element.
+    """
+    present = values.dropna()
+    if present.empty:
+        return None
+    sample = str(present.iloc[0]).strip()
+    return _detect_format(sample) or guess_datetime_format(sample)
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Coerce a column to datetimes, using an explicit format when the first value matches one.
+
+    Falls back to pandas' own inference when no known format fits or when the
+    detected format fails on values that are present.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    present = values.dropna()
+    if not present.empty:
+        fmt = _detect_format(str(present.iloc[0]).strip())
+        if fmt is not None:
+            parsed = pd.to_datetime(values, format=fmt, errors="coerce", cache=True)
+            if parsed.notna().sum() == len(present):
+                return parsed
+    return pd.to_datetime(values, errors="coerce", cache=True)
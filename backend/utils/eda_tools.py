@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+from utils.date_parsing import parse_dates
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 VALIDATED_DIR = BASE_DIR / "data" / "validated"
 RAW_FILE = VALIDATED_DIR / "validated_raw_data.csv"
@@ -18,6 +22,15 @@ _GRANULARITY_FREQ = {
     "weekly": "W-MON",
     "monthly": "MS",
 }
+_DAY_LABELS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTH_LABELS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _fresh_parquet(csv_path: Path) -> Path | None:
+    cache = csv_path.with_suffix(".parquet")
+    if cache.is_file() and cache.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns:
+        return cache
+    return None
 
 
 def _resolve_dataset_path(granularity: str) -> Path:
@@ -28,19 +41,54 @@ def _resolve_dataset_path(granularity: str) -> Path:
         "monthly": VALIDATED_DIR / "monthly_data.csv",
     }
     candidate = file_map.get(normalized, RAW_FILE)
-    if candidate.is_file():
-        return candidate
-    if RAW_FILE.is_file():
-        return RAW_FILE
-    raise FileNotFoundError(f"No validated datasets found for granularity='{granularity}'.")
+    if not candidate.is_file():
+        candidate = RAW_FILE
+    if not candidate.is_file():
+        raise FileNotFoundError(f"No validated datasets found for granularity='{granularity}'.")
+    return _fresh_parquet(candidate) or candidate
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache: Path) -> None:
+    # Best effort: a failed cache write only means the CSV is parsed again next time.
+    # Concurrent misses are not merged, so each writer stages under its own name.
+    staging: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=cache.parent, prefix=f"{cache.name}.", suffix=".tmp", delete=False
+        ) as handle:
+            staging = Path(handle.name)
+            df.to_parquet(handle, index=False, compression="zstd")
+        staging.replace(cache)
+    except (OSError, TypeError, ValueError):
+        if staging is not None:
+            staging.unlink(missing_ok=True)
+
+
+def _read_csv_dataset(csv_path: Path) -> pd.DataFrame:
+    df = pd.read_csv(csv_path)
+    if DEFAULT_DATE_COLUMN in df.columns:
+        df[DEFAULT_DATE_COLUMN] = parse_dates(df[DEFAULT_DATE_COLUMN])
+    _write_parquet_cache(df, csv_path.with_suffix(".parquet"))
+    return df
+
+
+@lru_cache(maxsize=8)
+def _read_dataset(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    # mtime/size are part of the cache key so rewritten files are re-read.
+    if not path.endswith(".parquet"):
+        return _read_csv_dataset(Path(path))
+    try:
+        return pd.read_parquet(path)
+    except (OSError, ValueError):
+        # An unreadable sidecar is rebuilt from the CSV it was derived from.
+        return _read_csv_dataset(Path(path).with_suffix(".csv"))
 
 
 def load_data(granularity: str = "daily") -> pd.DataFrame:
     path = _resolve_dataset_path(granularity)
-    df = pd.read_csv(path)
-    if DEFAULT_DATE_COLUMN in df.columns:
-        df[DEFAULT_DATE_COLUMN] = pd.to_datetime(df[DEFAULT_DATE_COLUMN], errors="coerce")
-    return df
+    stat = path.stat()
+    # Shallow copy so callers adding columns never touch the cached frame.
+    return _read_dataset(str(path), stat.st_mtime_ns, stat.st_size).copy(deep=False)
 
 
 def get_data_head(df: pd.DataFrame, limit: int = 10) -> List[Dict[str, str | float | int | None]]:
@@ -65,24 +113,28 @@ def basic_summary(df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
         df,
         preferred=("sales_qty", "sales_value", "price", "inventory_qty", "cogs_per_line"),
     )
+    if not numeric_cols:
+        return {}
+    numeric = df[numeric_cols]
+    stats = numeric.agg(["count", "mean", "median", "min", "max"])
+    stats.loc["std"] = numeric.std(ddof=0)
     summary: Dict[str, Dict[str, float]] = {}
-    for col in numeric_cols:
-        series = df[col].dropna()
-        if series.empty:
+    for col, values in stats.items():
+        if values["count"] == 0:
             continue
         summary[col] = {
-            "count": int(series.count()),
-            "mean": float(series.mean()),
-            "median": float(series.median()),
-            "std": float(series.std(ddof=0)),
-            "min": float(series.min()),
-            "max": float(series.max()),
+            "count": int(values["count"]),
+            "mean": float(values["mean"]),
+            "median": float(values["median"]),
+            "std": float(values["std"]),
+            "min": float(values["min"]),
+            "max": float(values["max"]),
         }
     return summary
 
 
 def missing_summary(df: pd.DataFrame) -> Dict[str, int]:
-    return {col: int(total) for col, total in df.isna().sum().items()}
+    return df.isna().sum().astype("int64").to_dict()
 
 
 def outlier_info(df: pd.DataFrame, column: str = DEFAULT_VALUE_COLUMN) -> Dict[str, float | int]:
@@ -108,7 +160,19 @@ def correlation_summary(df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
     numeric = df.select_dtypes(include=np.number)
     if numeric.empty:
         return {}
-    return numeric.corr().round(3).replace({np.nan: None}).to_dict()
+    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any() or len(values) < 2:
+        # Pairwise-complete statistics differ per column pair; leave those to pandas.
+        corr = numeric.corr()
+    else:
+        centered = values - values.mean(axis=0)
+        cov = centered.T @ centered
+        scale = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            matrix = np.clip(cov / np.outer(scale, scale), -1.0, 1.0)
+        corr = pd.DataFrame(matrix, index=numeric.columns, columns=numeric.columns)
+    # Adding 0.0 folds the -0.0 that rounding tiny negatives produces into 0.0.
+    return (corr.round(3) + 0.0).replace({np.nan: None}).to_dict()
 
 
 def _value_column(df: pd.DataFrame) -> str:
@@ -131,13 +195,15 @@ def timeseries_summary(
 ) -> List[Dict[str, float | str]]:
     if date_col not in df.columns:
         raise ValueError(f"Column '{date_col}' missing for time-series analysis.")
-    working = df.dropna(subset=[date_col]).copy()
-    working[date_col] = pd.to_datetime(working[date_col], errors="coerce")
+    working = df.dropna(subset=[date_col])
+    working = working.assign(**{date_col: pd.to_datetime(working[date_col], errors="coerce")})
     working = working.dropna(subset=[date_col])
     value_col = _value_column(working)
     freq = _granularity_freq(granularity)
+    # Project to the two needed columns before sorting so the rest of the frame is never shuffled.
     grouped = (
-        working.set_index(date_col)
+        working[[date_col, value_col]]
+        .set_index(date_col)
         .sort_index()
         .resample(freq)[value_col]
         .sum()
@@ -147,9 +213,10 @@ def timeseries_summary(
     if grouped.empty:
         return []
     window = {"D": 7, "W-MON": 4, "MS": 3}.get(freq, 7)
-    grouped["rolling_mean"] = grouped["value"].rolling(window, min_periods=1).mean()
-    grouped["rolling_std"] = grouped["value"].rolling(window, min_periods=1).std(ddof=0)
-    grouped["rolling_var"] = grouped["value"].rolling(window, min_periods=1).var(ddof=0)
+    rolling = grouped["value"].rolling(window, min_periods=1)
+    grouped["rolling_mean"] = rolling.mean()
+    grouped["rolling_var"] = rolling.var(ddof=0)
+    grouped["rolling_std"] = np.sqrt(grouped["rolling_var"])
     grouped["date"] = grouped[date_col].dt.date.astype(str)
     return grouped[["date", "value", "rolling_mean", "rolling_std", "rolling_var"]].fillna(0).to_dict(
         orient="records"
@@ -163,33 +230,26 @@ def series_coverage_summary(
 ) -> List[Dict[str, str | int]]:
     if id_col not in df.columns or date_col not in df.columns:
         return []
-    working = df.dropna(subset=[id_col, date_col]).copy()
+    working = df.dropna(subset=[id_col, date_col])
     if working.empty:
         return []
-    working[date_col] = pd.to_datetime(working[date_col], errors="coerce")
+    working = working.assign(**{date_col: pd.to_datetime(working[date_col], errors="coerce")})
     working = working.dropna(subset=[date_col])
     if working.empty:
         return []
     coverage = (
-        working.groupby(id_col)[date_col]
+        working.groupby(id_col, observed=True)[date_col]
         .agg(["min", "max", "nunique"])
         .rename(columns={"nunique": "observations"})
     )
-    results = []
-    for idx, row in coverage.iterrows():
-        start = row["min"].date()
-        end = row["max"].date()
-        span_days = (end - start).days + 1
-        results.append(
-            {
-                "series_id": idx,
-                "start_date": start.isoformat(),
-                "end_date": end.isoformat(),
-                "observations": int(row["observations"]),
-                "span_days": int(span_days),
-            }
-        )
-    return results
+    coverage["start_date"] = coverage["min"].dt.strftime("%Y-%m-%d")
+    coverage["end_date"] = coverage["max"].dt.strftime("%Y-%m-%d")
+    coverage["span_days"] = (coverage["max"].dt.normalize() - coverage["min"].dt.normalize()).dt.days + 1
+    coverage = coverage.astype({"observations": "int64", "span_days": "int64"})
+    coverage = coverage.rename_axis("series_id").reset_index()
+    return coverage[["series_id", "start_date", "end_date", "observations", "span_days"]].to_dict(
+        orient="records"
+    )
 
 
 def trend_curves(
@@ -199,42 +259,56 @@ def trend_curves(
 ) -> List[Dict[str, float | str]]:
     if date_col not in df.columns:
         return []
-    working = df.dropna(subset=[date_col]).copy()
-    working[date_col] = pd.to_datetime(working[date_col], errors="coerce")
+    working = df.dropna(subset=[date_col])
+    working = working.assign(**{date_col: pd.to_datetime(working[date_col], errors="coerce")})
     working = working.dropna(subset=[date_col])
     if working.empty:
         return []
     value_col = _value_column(working)
-    agg_series = None
+    dates = working[date_col]
     if granularity == "daily":
-        working["label"] = working[date_col].dt.day_name()
-        order = list(range(7))
-        working["order"] = working[date_col].dt.dayofweek
-        agg_series = (
-            working.groupby(["order", "label"])[value_col]
-            .mean()
-            .reset_index()
-            .sort_values("order")
-        )
+        order = dates.dt.dayofweek.to_numpy(dtype=np.int64)
+        labels = list(_DAY_LABELS)
     elif granularity == "weekly":
-        working["order"] = working[date_col].dt.isocalendar().week.astype(int)
-        working["label"] = working["order"].astype(str).str.zfill(2)
-        agg_series = (
-            working.groupby(["order", "label"])[value_col]
-            .mean()
-            .reset_index()
-            .sort_values("order")
-        )
+        order = dates.dt.isocalendar().week.to_numpy(dtype=np.int64)
+        labels = [str(week).zfill(2) for week in range(54)]
     else:
-        working["order"] = working[date_col].dt.month
-        working["label"] = working[date_col].dt.month_name().str[:3]
-        agg_series = (
-            working.groupby(["order", "label"])[value_col]
-            .mean()
-            .reset_index()
-            .sort_values("order")
-        )
-    return [{"label": row["label"], "value": float(row[value_col])} for _, row in agg_series.iterrows()]
+        order = dates.dt.month.to_numpy(dtype=np.int64) - 1
+        labels = list(_MONTH_LABELS)
+    values = working[value_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(values)
+    size = len(labels)
+    # Buckets with rows but no usable values still appear, as NaN, like a groupby mean would.
+    present = np.bincount(order, minlength=size) > 0
+    totals = np.bincount(order[valid], weights=values[valid], minlength=size)
+    counts = np.bincount(order[valid], minlength=size)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = totals / counts
+    return [{"label": labels[bucket], "value": float(means[bucket])} for bucket in np.flatnonzero(present)]
+
+
+def _integer_histogram(values: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Equal-width histogram for integer data without np.histogram's sort.
+
+    Bin indices come from exact integer arithmetic and are then nudged against the
+    float edges the same way np.histogram does, so counts match it exactly.
+    """
+    lo, hi = int(values.min()), int(values.max())
+    edges = np.linspace(lo, hi, bins + 1)
+    idx = (values - lo) * bins // (hi - lo)
+    idx = np.minimum(idx, bins - 1)
+    idx -= values < edges[idx]
+    idx += (values >= edges[idx + 1]) & (idx != bins - 1)
+    return np.bincount(idx, minlength=bins), edges
+
+
+def _fits_integer_histogram(series: pd.Series, bins: int) -> bool:
+    """Integer data whose scaled offsets, (value - min) * bins, cannot overflow int64."""
+    if not pd.api.types.is_integer_dtype(series.dtype) or bins < 1:
+        return False
+    lo, hi = int(series.min()), int(series.max())
+    return lo < hi and hi - lo <= np.iinfo(np.int64).max // bins
 
 
 def distribution_summary(
@@ -247,5 +321,8 @@ def distribution_summary(
     series = df[column].dropna()
     if series.empty:
         return {"bins": [], "counts": []}
-    counts, edges = np.histogram(series, bins=bins)
+    if _fits_integer_histogram(series, bins):
+        counts, edges = _integer_histogram(series.to_numpy(dtype=np.int64), bins)
+    else:
+        counts, edges = np.histogram(series, bins=bins)
     return {"bins": edges.tolist(), "counts": counts.astype(int).tolist()}
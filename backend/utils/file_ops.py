@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-import json
+import atexit
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, TextIO, Tuple
+
+import orjson
+
+# Match stdlib json's tolerance for non-str keys and accept NumPy values from pandas code paths.
+_JSON_WRITE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+_LOG_HANDLES: Dict[Path, Tuple[TextIO, threading.Lock]] = {}
+_LOG_HANDLES_LOCK = threading.Lock()
 
 
 def ensure_directory(path: Path) -> Path:
@@ -14,21 +23,34 @@ def ensure_directory(path: Path) -> Path:
 
 def write_json(path: Path, data: Any) -> None:
     ensure_directory(path.parent)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    path.write_bytes(orjson.dumps(data, option=_JSON_WRITE_OPTIONS))
 
 
 def read_json(path: Path, default: Any) -> Any:
     if not path.exists():
         return default
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        return orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError:
         return default
 
 
+def _log_handle(path: Path) -> Tuple[TextIO, threading.Lock]:
+    """Return a cached line-buffered append handle so each entry skips open/close."""
+    with _LOG_HANDLES_LOCK:
+        entry = _LOG_HANDLES.get(path)
+        if entry is None:
+            ensure_directory(path.parent)
+            handle = path.open("a", encoding="utf-8", buffering=1)
+            atexit.register(handle.close)
+            entry = (handle, threading.Lock())
+            _LOG_HANDLES[path] = entry
+        return entry
+
+
 def append_audit_log(path: Path, action: str, role: str, env: str) -> None:
-    ensure_directory(path.parent)
     timestamp = datetime.utcnow().isoformat() + "Z"
     line = f"{timestamp} | env={env} | role={role} | {action}\n"
-    with path.open("a", encoding="utf-8") as log_file:
-        log_file.write(line)
\ No newline at end of file
+    handle, lock = _log_handle(path)
+    with lock:
+        handle.write(line)
\ No newline at end of file
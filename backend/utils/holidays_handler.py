@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
-from typing import Dict, List
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import holidays
 from fastapi import HTTPException, status
@@ -23,6 +24,13 @@ def _normalize_country(country: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=256)
+def _country_calendar(country: str, years: Tuple[int, ...]) -> holidays.HolidayBase:
+    # Materializes every holiday in the requested years up front.
+    return holidays.country_holidays(country, years=years)
+
+
+@lru_cache(maxsize=512)
 def get_holidays(country: str, start: date, end: date) -> List[Dict[str, str]]:
     if start > end:
         raise HTTPException(
@@ -32,22 +40,15 @@ def get_holidays(country: str, start: date, end: date) -> List[Dict[str, str]]:
 
     normalized_country = _normalize_country(country.upper())
     try:
-        calendar = holidays.country_holidays(normalized_country)
+        calendar = _country_calendar(normalized_country, tuple(range(start.year, end.year + 1)))
     except NotImplementedError as exc:
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
             detail="Holidays not available for the requested country.",
         ) from exc
 
-    cursor = start
-    results: List[Dict[str, str]] = []
-    while cursor <= end:
-        name = calendar.get(cursor)
-        if name:
-            results.append({
-                "date": cursor.isoformat(),
-                "name": name,
-            })
-        cursor += timedelta(days=1)
-
-    return results
\ No newline at end of file
+    return [
+        {"date": day.isoformat(), "name": name}
+        for day, name in sorted(calendar.items())
+        if start <= day <= end
+    ]
@@ -2,11 +2,19 @@ from __future__ import annotations
 
 import csv
 from datetime import datetime
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
 REQUIRED_PROMO_COLUMNS = ["name", "start_date", "end_date", "type"]
+# Plain calendar dates (optionally with a naive time) that pandas and fromisoformat read identically.
+_PLAIN_ISO_PATTERN = r"[0-9]{4}-[0-9]{2}-[0-9]{2}(?:[T ][0-9]{2}(?::[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{1,6})?)?)?)?"
 
 
 def _parse_rows_from_reader(reader: csv.DictReader) -> List[Dict[str, str]]:
@@ -16,22 +24,49 @@ def _parse_rows_from_reader(reader: csv.DictReader) -> List[Dict[str, str]]:
     return rows
 
 
+def _read_arrow_rows(open_source: Callable[[], Any]) -> Tuple[List[Dict[str, str]], List[str]]:
+    """
+    Parse CSV with Arrow's multi-threaded reader, keeping every column as trimmed text.
+
+    open_source is called once for the header and once for the full read. Raises
+    pa.ArrowInvalid for input Arrow cannot represent, so callers can fall back.
+    """
+    with pacsv.open_csv(open_source()) as header_reader:
+        fieldnames = header_reader.schema.names
+    if len(set(fieldnames)) != len(fieldnames):
+        raise pa.ArrowInvalid("CSV header repeats a column name")
+    table = pacsv.read_csv(
+        open_source(),
+        convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in fieldnames}),
+    )
+    trimmed = pa.table({name: pc.utf8_trim_whitespace(table[name]) for name in fieldnames})
+    return trimmed.to_pylist(), fieldnames
+
+
 def read_promo_calendar(path: Path) -> List[Dict[str, str]]:
     if not path.exists():
         return []
-    with path.open("r", encoding="utf-8") as csv_file:
-        reader = csv.DictReader(csv_file)
-        return _parse_rows_from_reader(reader)
+    try:
+        rows, _ = _read_arrow_rows(lambda: str(path))
+        return rows
+    except pa.ArrowInvalid:
+        # Ragged, empty or repeated-header files: the csv module tolerates all three.
+        with path.open("r", encoding="utf-8") as csv_file:
+            reader = csv.DictReader(csv_file)
+            return _parse_rows_from_reader(reader)
 
 
 def rows_from_bytes(file_bytes: bytes) -> Tuple[List[Dict[str, str]], List[str]]:
-    content = file_bytes.decode("utf-8-sig")
-    reader = csv.DictReader(StringIO(content))
-    fieldnames = reader.fieldnames or []
+    try:
+        rows, fieldnames = _read_arrow_rows(lambda: BytesIO(file_bytes))
+    except pa.ArrowInvalid:
+        reader = csv.DictReader(StringIO(file_bytes.decode("utf-8-sig")))
+        fieldnames = reader.fieldnames or []
+        rows = _parse_rows_from_reader(reader)
     missing_columns = [
         column for column in REQUIRED_PROMO_COLUMNS if column not in fieldnames
     ]
-    return _parse_rows_from_reader(reader), missing_columns
+    return rows, missing_columns
 
 
 def write_uploaded_calendar(temp_path: Path, file_bytes: bytes) -> None:
@@ -39,22 +74,49 @@ def write_uploaded_calendar(temp_path: Path, file_bytes: bytes) -> None:
     temp_path.write_bytes(file_bytes)
 
 
-def validate_promo_rows(rows: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
-    preview = rows[:5]
-    invalid: List[Dict[str, str]] = []
+def _parse_iso_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a column with datetime.fromisoformat semantics; unparseable values come back missing.
 
-    for row in rows:
-        missing_columns = [col for col in REQUIRED_PROMO_COLUMNS if not row.get(col)]
+    Plain YYYY-MM-DD shapes go through one vectorized pandas parse; anything else (week
+    dates, basic format, offsets) is handed to fromisoformat value by value.
+    """
+    text = values.fillna("").astype(str)
+    shaped = text.str.fullmatch(_PLAIN_ISO_PATTERN)
+    parsed = pd.to_datetime(text.where(shaped), errors="coerce", format="ISO8601")
+    if shaped.all():
+        return parsed
+
+    parsed = parsed.astype(object).where(shaped, None)
+    for position in np.flatnonzero(~shaped.to_numpy()):
         try:
-            start = datetime.fromisoformat(row.get("start_date", ""))
-            end = datetime.fromisoformat(row.get("end_date", ""))
-            if start > end:
-                missing_columns.append("date_order")
+            parsed.iat[position] = datetime.fromisoformat(text.iat[position])
         except ValueError:
-            missing_columns.append("date_format")
+            continue
+    return parsed
+
 
-        if missing_columns:
-            invalid.append({"row": row, "issues": missing_columns})
+def validate_promo_rows(rows: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    preview = rows[:5]
+    if not rows:
+        return preview, []
+
+    frame = pd.DataFrame(rows, columns=REQUIRED_PROMO_COLUMNS)
+    missing = (frame.isna() | frame.eq("")).to_numpy()
+    starts = _parse_iso_dates(frame["start_date"])
+    ends = _parse_iso_dates(frame["end_date"])
+    bad_format = (starts.isna() | ends.isna()).to_numpy()
+    bad_order = np.zeros(len(frame), dtype=bool)
+    bad_order[~bad_format] = (starts[~bad_format] > ends[~bad_format]).to_numpy()
+
+    invalid: List[Dict[str, str]] = []
+    for position in np.flatnonzero(missing.any(axis=1) | bad_format | bad_order):
+        issues = [col for col, flagged in zip(REQUIRED_PROMO_COLUMNS, missing[position]) if flagged]
+        if bad_format[position]:
+            issues.append("date_format")
+        elif bad_order[position]:
+            issues.append("date_order")
+        invalid.append({"row": rows[position], "issues": issues})
 
     return preview, invalid
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Tuple
 
 import pandas as pd
@@ -66,21 +67,32 @@ CANONICAL_COLUMNS: CanonicalMap = {
 }
 
 
+def _build_exact_matches() -> Dict[str, str]:
+    matches: Dict[str, str] = {}
+    for canonical, synonyms in CANONICAL_COLUMNS.items():
+        for name in (canonical, *synonyms):
+            matches.setdefault(name, canonical)
+    return matches
+
+
+# Flattened lookups built once at import; earlier canonical entries win ties.
+_EXACT_MATCHES = _build_exact_matches()
+_SUBSTRING_MATCHES: Tuple[Tuple[str, str], ...] = tuple(
+    (synonym, canonical) for canonical, synonyms in CANONICAL_COLUMNS.items() for synonym in synonyms
+)
+
+
 def _normalize(name: str) -> str:
     return str(name).strip().lower().replace(" ", "_")
 
 
+@lru_cache(maxsize=1024)
 def _match_canonical(column: str) -> str | None:
     normalized = _normalize(column)
-    for canonical, synonyms in CANONICAL_COLUMNS.items():
-        if normalized == canonical or normalized in synonyms:
-            return canonical
-
-    for canonical, synonyms in CANONICAL_COLUMNS.items():
-        for synonym in synonyms:
-            if synonym in normalized:
-                return canonical
-    return None
+    exact = _EXACT_MATCHES.get(normalized)
+    if exact:
+        return exact
+    return next((canonical for synonym, canonical in _SUBSTRING_MATCHES if synonym in normalized), None)
 
 
 def standardize_columns(df: pd.DataFrame) -> tuple[pd.DataFrame, Dict[str, str]]:
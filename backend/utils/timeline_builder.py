@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -25,22 +26,23 @@ def build_continuous_timeline(
     df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
     if df[date_col].isna().all():
         raise ValueError("Date column could not be parsed for timeline construction.")
+    df[id_col] = df[id_col].astype("category")
+
+    # Lay out every series' daily span in one scaffold, then fill it with a single merge.
+    spans = df.groupby(id_col, observed=True)[date_col].agg(["min", "max"]).dropna()
+    lengths = ((spans["max"] - spans["min"]) // pd.Timedelta(days=1)).to_numpy(dtype=np.int64) + 1
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    scaffold = pd.DataFrame(
+        {
+            id_col: pd.Categorical.from_codes(
+                np.repeat(spans.index.codes, lengths), dtype=df[id_col].dtype
+            ),
+            date_col: np.repeat(spans["min"].to_numpy(), lengths) + offsets * np.timedelta64(1, "D"),
+        }
+    )
+    combined = scaffold.merge(df, on=[id_col, date_col], how="left")
+    missing_rows = int(combined.isna().any(axis=1).sum())
 
-    frames: list[pd.DataFrame] = []
-    missing_rows = 0
-
-    for series_id, group in df.groupby(id_col):
-        group = group.sort_values(date_col)
-        full_dates = pd.date_range(group[date_col].min(), group[date_col].max(), freq="D")
-        merged = pd.DataFrame({id_col: series_id, date_col: full_dates}).merge(
-            group,
-            on=[id_col, date_col],
-            how="left",
-        )
-        missing_rows += int(merged.isna().any(axis=1).sum())
-        frames.append(merged)
-
-    combined = pd.concat(frames, ignore_index=True)
     CONTINUOUS_OUTPUT.parent.mkdir(parents=True, exist_ok=True)
     combined.to_csv(CONTINUOUS_OUTPUT, index=False)
 
@@ -49,3 +51,8 @@ def build_continuous_timeline(
         "missing_dates_filled": missing_rows,
         "output_file": str(CONTINUOUS_OUTPUT.relative_to(BASE_DIR)),
     }
+
+
+def build_timeline_from_file(path: Path) -> Dict[str, int | str]:
+    """Load a validated CSV and build its timeline; suited to worker processes."""
+    return build_continuous_timeline(pd.read_csv(path, engine="pyarrow"))
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from utils.date_parsing import infer_date_format
 from utils.file_ops import ensure_directory, read_json
 from utils.schema_standardizer import standardize_columns
 
@@ -17,6 +20,8 @@ UPLOADS_DIR = DATA_DIR / "uploads"
 VALIDATED_DIR = DATA_DIR / "validated"
 VALIDATED_FILE = VALIDATED_DIR / "validated_raw_data.csv"
 LATEST_UPLOAD_INFO = UPLOADS_DIR / "latest_upload.json"
+VALIDATION_CHUNK_ROWS = 256_000
+_KEY_MULTIPLIER = 0x100000001B3  # odd 64-bit FNV prime used to mix the id and date hashes
 
 
 @dataclass
@@ -40,10 +45,11 @@ class ValidationSummary:
 
 
 def _latest_upload_path(upload_dir: Path) -> Path:
-    files = sorted(upload_dir.glob("*.csv"), key=lambda p: p.stat().st_mtime)
-    if not files:
+    # Ties on mtime fall back to the name, whose timestamp prefix orders uploads.
+    latest = max(upload_dir.glob("*.csv"), key=lambda p: (p.stat().st_mtime, p.name), default=None)
+    if latest is None:
         raise FileNotFoundError("No uploaded CSV files were found.")
-    return files[-1]
+    return latest
 
 
 def _resolve_target_file(filename: Optional[str]) -> Path:
@@ -69,18 +75,14 @@ def _resolve_target_file(filename: Optional[str]) -> Path:
     return _latest_upload_path(uploads_dir)
 
 
-def _detect_granularity(dates: pd.Series) -> str:
-    unique_dates = (
-        pd.Series(pd.to_datetime(dates, errors="coerce"))
-        .dropna()
-        .sort_values()
-        .drop_duplicates()
-    )
-    deltas = unique_dates.diff().dt.days.dropna()
-    if deltas.empty:
+def _detect_granularity(dates: np.ndarray) -> str:
+    unique_dates = np.unique(dates[~np.isnat(dates)])
+    if unique_dates.size < 2:
         return "daily"
 
-    gap = int(deltas.mode().iloc[0])
+    # Whole-day gaps between sorted unique dates; bincount's argmax is their mode.
+    deltas = np.diff(unique_dates).astype("timedelta64[D]").astype(np.int64)
+    gap = int(np.bincount(deltas).argmax())
     if gap <= 1:
         return "daily"
     if gap <= 7:
@@ -88,49 +90,136 @@ def _detect_granularity(dates: pd.Series) -> str:
     return "monthly"
 
 
-def validate_data(filename: Optional[str] = None) -> Dict[str, Any]:
-    validated_dir = ensure_directory(VALIDATED_DIR)
-    target = _resolve_target_file(filename)
+def _sniff_columns(target: Path) -> Dict[str, str]:
+    """Map canonical column names to the raw header names they were matched from."""
+    header = pd.read_csv(target, nrows=0).columns
+    stripped = [str(col).strip() for col in header]
+    _, rename_map = standardize_columns(pd.DataFrame(columns=stripped))
+    return {rename_map[name]: raw for name, raw in zip(stripped, header) if name in rename_map}
 
-    df = pd.read_csv(target)
-    if df.empty:
-        raise ValueError("Uploaded CSV has no rows to validate.")
 
-    rows_before = len(df)
-    df.columns = [str(col).strip() for col in df.columns]
-    df, _ = standardize_columns(df)
+def _clean_chunk(chunk: pd.DataFrame, date_format: Optional[str]) -> pd.DataFrame:
+    chunk.columns = [str(col).strip() for col in chunk.columns]
+    chunk, _ = standardize_columns(chunk)
 
-    if "date" not in df.columns:
+    if "date" not in chunk.columns:
         raise ValueError("Unable to detect a date column in the uploaded file.")
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    chunk["date"] = pd.to_datetime(chunk["date"], format=date_format or "mixed", errors="coerce")
 
-    if "series_id" not in df.columns:
-        df["series_id"] = "single_series"
-    series_col = df["series_id"].fillna("single_series")
-    df["series_id"] = series_col.astype(str).str.strip().replace("", "single_series")
+    if "series_id" not in chunk.columns:
+        chunk["series_id"] = "single_series"
+    series_col = chunk["series_id"].fillna("single_series")
+    chunk["series_id"] = series_col.astype(str).str.strip().replace("", "single_series").astype("category")
 
-    if "sales_qty" not in df.columns:
+    if "sales_qty" not in chunk.columns:
         raise ValueError("Unable to detect a sales quantity column in the uploaded file.")
-    df["sales_qty"] = pd.to_numeric(df["sales_qty"], errors="coerce")
+    chunk["sales_qty"] = pd.to_numeric(chunk["sales_qty"], errors="coerce")
+
+    return chunk.dropna(subset=["date", "sales_qty"])
+
+
+def _first_occurrences(chunk: pd.DataFrame, seen: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mask rows whose (series_id, date) key has not appeared in this or any earlier chunk.
 
-    df = df.dropna(subset=["date", "sales_qty"])
+    Keys are 64-bit hashes; seen is the sorted array of keys from earlier chunks and
+    is returned extended with this chunk's keys. Each distinct series_id is hashed once,
+    by value, and spread to rows through the category codes, so keys agree across chunks
+    even though every chunk has its own category set.
+    """
+    series_ids = chunk["series_id"].cat
+    id_hashes = pd.util.hash_array(series_ids.categories.to_numpy(dtype=object))[series_ids.codes.to_numpy()]
+    date_hashes = pd.util.hash_array(chunk["date"].to_numpy(dtype="datetime64[ns]").view(np.int64))
+    keys = id_hashes * np.uint64(_KEY_MULTIPLIER) ^ date_hashes
+    positions = np.searchsorted(seen, keys).clip(max=max(len(seen) - 1, 0))
+    earlier = seen[positions] == keys if len(seen) else np.zeros(len(keys), dtype=bool)
+    keep = ~earlier & ~pd.Series(keys).duplicated().to_numpy()
+    fresh = np.sort(keys[keep])
+    return keep, np.insert(seen, np.searchsorted(seen, fresh), fresh)
 
-    before_dedup = len(df)
-    df = df.sort_values(["series_id", "date"])
-    df = df.drop_duplicates(subset=["series_id", "date"])
-    duplicates_removed = before_dedup - len(df)
 
-    tracked_columns = [col for col in ("price", "inventory_level", "sales_qty", "series_id") if col in df.columns]
-    missing_counts = {col: int(df[col].isna().sum()) for col in tracked_columns}
+def _output_date_format(source_format: Optional[str]) -> str:
+    """
+    Choose one rendering for every chunk's dates.
 
-    detected_granularity = _detect_granularity(df["date"])
+    to_csv would otherwise drop the time from chunks that happen to be all midnight.
+    """
+    if source_format is not None and "%H" not in source_format and "%I" not in source_format:
+        return "%Y-%m-%d"
+    if source_format is not None and "%f" in source_format:
+        return "%Y-%m-%d %H:%M:%S.%f"
+    return "%Y-%m-%d %H:%M:%S"
 
+
+def validate_data(filename: Optional[str] = None) -> Dict[str, Any]:
+    validated_dir = ensure_directory(VALIDATED_DIR)
+    target = _resolve_target_file(filename)
     output_path = validated_dir / VALIDATED_FILE.name
-    df.to_csv(output_path, index=False)
+
+    rows_before = 0
+    rows_after = 0
+    duplicates_removed = 0
+    null_counts: Optional[pd.Series] = None
+    seen = np.empty(0, dtype=np.uint64)
+    chunk_dates: List[np.ndarray] = []
+    date_format: Optional[str] = None
+    output_date_format = "%Y-%m-%d"
+
+    # Pin the id column to text so every chunk renders ids the same way, whatever its nulls.
+    columns = _sniff_columns(target)
+    dtypes = {columns["series_id"]: str} if "series_id" in columns else None
+
+    # Stream the upload so peak memory is bounded by one chunk plus the dedup keys.
+    # Each call stages under its own name, since validations can run in parallel workers.
+    staging = tempfile.NamedTemporaryFile(
+        "w",
+        dir=validated_dir,
+        prefix=f"{output_path.name}.",
+        suffix=".tmp",
+        delete=False,
+        encoding="utf-8",
+        newline="",
+    )
+    staging_path = Path(staging.name)
+    try:
+        with staging:
+            for chunk in pd.read_csv(target, chunksize=VALIDATION_CHUNK_ROWS, dtype=dtypes):
+                if rows_before == 0 and "date" in columns:
+                    # Detected once so a later chunk cannot lock onto a different format.
+                    date_format = infer_date_format(chunk[columns["date"]])
+                    output_date_format = _output_date_format(date_format)
+                rows_before += len(chunk)
+                chunk = _clean_chunk(chunk, date_format)
+
+                keep, seen = _first_occurrences(chunk, seen)
+                duplicates_removed += int(len(chunk) - keep.sum())
+                chunk = chunk[keep]
+                rows_after += len(chunk)
+
+                tracked_columns = [
+                    col for col in ("price", "inventory_level", "sales_qty", "series_id") if col in chunk.columns
+                ]
+                chunk_nulls = chunk[tracked_columns].isna().sum()
+                null_counts = chunk_nulls if null_counts is None else null_counts + chunk_nulls
+
+                chunk_dates.append(np.unique(chunk["date"].to_numpy(dtype="datetime64[ns]")))
+                chunk.to_csv(
+                    staging, index=False, header=staging.tell() == 0, date_format=output_date_format
+                )
+
+        if rows_before == 0:
+            raise ValueError("Uploaded CSV has no rows to validate.")
+        staging_path.replace(output_path)
+    finally:
+        staging_path.unlink(missing_ok=True)
+
+    dates = np.concatenate(chunk_dates) if chunk_dates else np.array([], dtype="datetime64[ns]")
+    detected_granularity = _detect_granularity(dates)
+    missing_counts: Dict[str, int] = {} if null_counts is None else null_counts.astype("int64").to_dict()
 
     summary = ValidationSummary(
         rows_before=int(rows_before),
-        rows_after=int(len(df)),
+        rows_after=int(rows_after),
         duplicates_removed=int(duplicates_removed),
         missing_counts=missing_counts,
         detected_granularity=detected_granularity,
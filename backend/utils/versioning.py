@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+import string
+import unicodedata
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
@@ -9,14 +11,23 @@ from .file_ops import read_json, write_json
 
 HISTORY_FILENAME = "config_history.json"
 
+_SLUG_CHARS = frozenset(string.ascii_lowercase + string.digits)
+_SLUG_TABLE = {code: "-" for code in range(128) if chr(code) not in _SLUG_CHARS}
+_DASH_RUNS = re.compile(r"-{2,}")
+
 
 def build_history_path(config_root: Path) -> Path:
     return config_root / HISTORY_FILENAME
 
 
 def slugify(value: str) -> str:
-    value = value.lower().strip()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
+    value = value.strip()
+    if not value.isascii():
+        # Fold accents onto their base letters; anything left over becomes "?" and then a dash.
+        decomposed = unicodedata.normalize("NFKD", value)
+        value = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+        value = value.encode("ascii", "replace").decode("ascii")
+    value = _DASH_RUNS.sub("-", value.lower().translate(_SLUG_TABLE))
     return value.strip("-") or "config"
 
 
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # prefer the libyaml C bindings when PyYAML was built with them
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper, SafeLoader
+
 
 def dump_yaml(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as target:
-        yaml.safe_dump(payload, target, sort_keys=False)
+        yaml.dump(payload, target, Dumper=SafeDumper, sort_keys=False)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any | None:
+    # mtime/size are part of the cache key so rewritten configs are re-parsed.
+    with open(path, "r", encoding="utf-8") as source:
+        return yaml.load(source, Loader=SafeLoader)
 
 
 def load_yaml(path: Path) -> Any | None:
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return None
-    with path.open("r", encoding="utf-8") as source:
-        return yaml.safe_load(source)
\ No newline at end of file
+    # Deep copy so callers can edit the config without touching the cached parse.
+    return copy.deepcopy(_parse_yaml(str(path), stat.st_mtime_ns, stat.st_size))